@@ -1,5 +1,130 @@
 import os
-import json
+import stat
+
+# Directorios .vscode ya creados en este proceso; evita repetir os.makedirs().
+# set.add es atómico y os.makedirs(exist_ok=True) idempotente, así que no hace
+# falta un lock aunque _write se llame desde varios hilos.
+_ensured_dirs: set[str] = set()
+
+# Flags de os.open para el archivo temporal: O_EXCL garantiza un nombre único
+# y O_BINARY (solo en Windows) evita la conversión de saltos de línea.
+_TMP_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+
+# posix_fadvise no existe en Windows ni en macOS.
+_FADVISE = hasattr(os, "posix_fadvise")
+
+# Plantillas de c_cpp_properties.json. La forma del archivo es fija, así que
+# solo se sustituyen las rutas (ya escapadas como cadenas JSON) con format_map.
+_TPL_ESTANDAR = """{{
+    "configurations": [
+        {{
+            "name": "MSVC",
+            "includePath": [
+                "${{workspaceFolder}}/**"
+            ],
+            "compilerPath": {cl},
+            "cStandard": "c17",
+            "cppStandard": "c++20",
+            "intelliSenseMode": "windows-msvc-x64"
+        }}
+    ],
+    "version": 4
+}}"""
+
+_TPL_PYBIND = """{{
+    "configurations": [
+        {{
+            "name": "MSVC",
+            "includePath": [
+                "${{workspaceFolder}}/**",
+                {pybind11},
+                {python}
+            ],
+            "compilerPath": {cl},
+            "cStandard": "c17",
+            "cppStandard": "c++20",
+            "intelliSenseMode": "windows-msvc-x64"
+        }}
+    ],
+    "version": 4
+}}"""
+
+
+def _quote(valor: str) -> str:
+    """Escapa una ruta como cadena JSON usando json (con escapes ASCII)."""
+    # Importación diferida: json solo se carga cuando se genera una configuración.
+    import json
+    return json.dumps(valor)
+
+
+def _ensure_dir(dir_path: str) -> None:
+    """Crea dir_path si no se ha creado ya en este proceso."""
+    if dir_path not in _ensured_dirs:
+        os.makedirs(dir_path, exist_ok=True)
+        _ensured_dirs.add(dir_path)
+
+
+def _open_tmp(dir_path: str, file_path: str) -> tuple[int, str]:
+    """
+    Crea un archivo temporal con nombre único junto a file_path.
+    
+    Se abre con os.open(O_EXCL) y modo 0o666, de modo que el sistema aplica la
+    umask vigente igual que lo haría open().
+    
+    Returns:
+        tuple[int, str]: Descriptor abierto para escritura y ruta del temporal.
+    """
+    stem = os.path.splitext(os.path.basename(file_path))[0]
+    while True:
+        tmp_path = os.path.join(dir_path, f".{stem}.{os.urandom(8).hex()}.tmp")
+        try:
+            return os.open(tmp_path, _TMP_FLAGS, 0o666), tmp_path
+        except FileExistsError:
+            continue
+        except FileNotFoundError:
+            # El directorio se borró después de registrarlo: se vuelve a crear.
+            os.makedirs(dir_path, exist_ok=True)
+
+
+def _atomic_write(dir_path: str, file_path: str, payload: bytes) -> None:
+    """
+    Escribe payload en file_path de forma atómica.
+    
+    Se escribe un archivo temporal con nombre único en el mismo directorio (con
+    os.write sobre el descriptor, sin el buffer de io) y luego se reemplaza el
+    destino con os.replace(). Al ser único, varios escritores del mismo destino
+    no se pisan el temporal. Si el destino ya existe, se conservan sus permisos.
+    
+    Args:
+        dir_path: Directorio que contiene file_path; se crea si no existe.
+        file_path: Archivo de destino.
+        payload: Contenido a escribir.
+    """
+    _ensure_dir(dir_path)
+    try:
+        modo = stat.S_IMODE(os.stat(file_path).st_mode)
+    except FileNotFoundError:
+        modo = None
+    fd, tmp_path = _open_tmp(dir_path, file_path)
+    try:
+        try:
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+            os.fsync(fd)
+            if _FADVISE:
+                # El escritor no vuelve a leer el archivo: se liberan sus páginas
+                # de la caché del sistema (ya están en disco tras fsync).
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+        if modo is not None:
+            os.chmod(tmp_path, modo)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
 
 
 class Cpp_config:
@@ -35,6 +160,14 @@ class Cpp_config:
         ... )
         >>> config.config_pybind("C:/mi/proyecto")  # Ruta personalizada
     """
+    __slots__ = (
+        "_ruta_compilador",
+        "_python_dll",
+        "_pybind11_dll",
+        "_cached_estandar_bytes",
+        "_cached_pybind_bytes",
+    )
+
     def __init__(self, ruta_compilador: str | None = None, python_dll: str | None = None, pybind11_dll: str | None = None):
         """
         Inicializa el configurador con las rutas personalizadas.
@@ -48,72 +181,166 @@ class Cpp_config:
         self.python_dll = python_dll
         self.pybind11_dll = pybind11_dll
 
-    def _build_config_estandar(self) -> dict:
+    def _invalidar_cache(self) -> None:
+        """Descarta las configuraciones construidas previamente."""
+        self._cached_estandar_bytes = None
+        self._cached_pybind_bytes = None
+
+    def _validate_estandar(self) -> None:
+        """
+        Comprueba que las rutas necesarias para la configuración estándar estén definidas.
+        
+        Raises:
+            ValueError: Si ruta_compilador no está definida.
+        """
+        if not self.ruta_compilador:
+            raise ValueError("ruta_compilador es requerido")
+
+    def _validate_pybind(self) -> None:
+        """
+        Comprueba que las rutas necesarias para la configuración pybind11 estén definidas.
+        
+        Raises:
+            ValueError: Si falta ruta_compilador, python_dll o pybind11_dll.
+        """
+        if not self.ruta_compilador:
+            raise ValueError("ruta_compilador es requerido")
+        if not self.python_dll:
+            raise ValueError("python_dll es requerido")
+        if not self.pybind11_dll:
+            raise ValueError("pybind11_dll es requerido")
+
+    @property
+    def ruta_compilador(self) -> str | None:
+        """Ruta al compilador de MSVC (cl.exe)."""
+        return self._ruta_compilador
+
+    @ruta_compilador.setter
+    def ruta_compilador(self, valor: str | None) -> None:
+        self._ruta_compilador = valor
+        self._invalidar_cache()
+
+    @property
+    def python_dll(self) -> str | None:
+        """Ruta al directorio include de Python."""
+        return self._python_dll
+
+    @python_dll.setter
+    def python_dll(self, valor: str | None) -> None:
+        self._python_dll = valor
+        self._invalidar_cache()
+
+    @property
+    def pybind11_dll(self) -> str | None:
+        """Ruta al directorio include de pybind11."""
+        return self._pybind11_dll
+
+    @pybind11_dll.setter
+    def pybind11_dll(self, valor: str | None) -> None:
+        self._pybind11_dll = valor
+        self._invalidar_cache()
+
+    def _serialize_estandar(self) -> bytes:
         """
         Construye la configuración estándar de C++ sin pybind11.
         
+        El resultado se guarda en la instancia y se reutiliza hasta que se
+        modifique alguna de las rutas.
+        
         Returns:
-            dict: Diccionario con la configuración de c_cpp_properties.json.
+            bytes: Contenido de c_cpp_properties.json codificado en UTF-8.
         
         Raises:
             ValueError: Si ruta_compilador no está definida.
         """
-        if not self.ruta_compilador:
-            raise ValueError("ruta_compilador es requerido")
+        if self._cached_estandar_bytes is not None:
+            return self._cached_estandar_bytes
 
-        return {
-            "configurations": [
-                {
-                    "name": "MSVC",
-                    "includePath": [
-                        "${workspaceFolder}/**",
-                    ],
-                    "compilerPath": self.ruta_compilador,
-                    "cStandard": "c17",
-                    "cppStandard": "c++20",
-                    "intelliSenseMode": "windows-msvc-x64",
-                }
-            ],
-            "version": 4,
-        }
+        self._validate_estandar()
+
+        self._cached_estandar_bytes = _TPL_ESTANDAR.format_map({
+            "cl": _quote(self.ruta_compilador),
+        }).encode("utf-8")
+        return self._cached_estandar_bytes
 
-    def _build_config_pybind(self) -> dict:
+    def _serialize_pybind(self) -> bytes:
         """
         Construye la configuración de C++ con soporte para pybind11.
         
         Incluye las rutas de Python y pybind11 en includePath para permitir
-        el desarrollo de extensiones de Python en C++.
+        el desarrollo de extensiones de Python en C++. El resultado se guarda en
+        la instancia y se reutiliza hasta que se modifique alguna de las rutas.
         
         Returns:
-            dict: Diccionario con la configuración de c_cpp_properties.json.
+            bytes: Contenido de c_cpp_properties.json codificado en UTF-8.
         
         Raises:
             ValueError: Si falta ruta_compilador, python_dll o pybind11_dll.
         """
-        if not self.ruta_compilador:
-            raise ValueError("ruta_compilador es requerido")
-        if not self.python_dll:
-            raise ValueError("python_dll es requerido")
-        if not self.pybind11_dll:
-            raise ValueError("pybind11_dll es requerido")
+        if self._cached_pybind_bytes is not None:
+            return self._cached_pybind_bytes
 
-        return {
-            "configurations": [
-                {
-                    "name": "MSVC",
-                    "includePath": [
-                        "${workspaceFolder}/**",
-                        self.pybind11_dll,
-                        self.python_dll,
-                    ],
-                    "compilerPath": self.ruta_compilador,
-                    "cStandard": "c17",
-                    "cppStandard": "c++20",
-                    "intelliSenseMode": "windows-msvc-x64",
-                }
-            ],
-            "version": 4,
-        }
+        self._validate_pybind()
+
+        self._cached_pybind_bytes = _TPL_PYBIND.format_map({
+            "cl": _quote(self.ruta_compilador),
+            "pybind11": _quote(self.pybind11_dll),
+            "python": _quote(self.python_dll),
+        }).encode("utf-8")
+        return self._cached_pybind_bytes
+
+    def config_estandar_bytes(self) -> bytes:
+        """
+        Devuelve el contenido de c_cpp_properties.json estándar sin escribirlo a disco.
+        
+        Útil para enviar la configuración por stdin o incrustarla en otro
+        generador sin pasar por el sistema de archivos.
+        
+        Returns:
+            bytes: Contenido JSON codificado en UTF-8.
+        
+        Raises:
+            ValueError: Si ruta_compilador no está definida.
+        
+        Ejemplo:
+            >>> config = Cpp_config(ruta_compilador="C:/ruta/al/cl.exe")
+            >>> sys.stdout.buffer.write(config.config_estandar_bytes())
+        """
+        return self._serialize_estandar()
+
+    def config_pybind_bytes(self) -> bytes:
+        """
+        Devuelve el contenido de c_cpp_properties.json con pybind11 sin escribirlo a disco.
+        
+        Returns:
+            bytes: Contenido JSON codificado en UTF-8.
+        
+        Raises:
+            ValueError: Si falta ruta_compilador, python_dll o pybind11_dll.
+        
+        Ejemplo:
+            >>> config = Cpp_config_auto()
+            >>> contenido = config.config_pybind_bytes().decode("utf-8")
+        """
+        return self._serialize_pybind()
+
+    def _write(self, ruta: str | None, payload: bytes) -> None:
+        """
+        Escribe el contenido ya serializado en .vscode/c_cpp_properties.json.
+        
+        La escritura es atómica (ver _atomic_write), de modo que VS Code nunca lee
+        un archivo a medio escribir.
+        
+        Args:
+            ruta: Ruta del proyecto. Si es None, usa "." (el directorio actual).
+            payload: Contenido JSON codificado en UTF-8.
+        """
+        if ruta is None:
+            # Ruta relativa: siempre sigue al directorio de trabajo real sin
+            # necesidad de llamar a os.getcwd().
+            ruta = "."
+        vscode_dir = os.path.join(ruta, ".vscode")
+        _atomic_write(vscode_dir, os.path.join(vscode_dir, "c_cpp_properties.json"), payload)
 
     def config_estandar(self, ruta: str | None = None) -> None:
         """
@@ -124,18 +351,44 @@ class Cpp_config:
         
         Args:
             ruta: Ruta del proyecto donde crear .vscode/c_cpp_properties.json.
-                  Si es None, usa el directorio actual (os.getcwd()).
+                  Si es None, usa "." (el directorio actual).
         
         Ejemplo:
             >>> config = Cpp_config(ruta_compilador="C:/ruta/al/cl.exe")
             >>> config.config_estandar()  # Genera en directorio actual
             >>> config.config_estandar("C:/mi/proyecto")  # Genera en ruta específica
         """
-        if ruta is None:
-            ruta = os.getcwd()
-        os.makedirs(f"{ruta}/.vscode", exist_ok=True)
-        with open(f"{ruta}/.vscode/c_cpp_properties.json", "w") as f:
-            json.dump(self._build_config_estandar(), f, indent=4)
+        self._write(ruta, self._serialize_estandar())
+
+    def config_estandar_many(self, rutas: list[str]) -> None:
+        """
+        Genera c_cpp_properties.json con configuración estándar en varios proyectos.
+        
+        El contenido se serializa una sola vez y las escrituras se reparten en
+        un pool de hilos, útil para preparar muchos espacios de trabajo a la vez.
+        Las rutas repetidas (una vez normalizadas) se escriben una sola vez.
+        
+        Args:
+            rutas: Rutas de los proyectos donde crear .vscode/c_cpp_properties.json.
+        
+        Raises:
+            ValueError: Si ruta_compilador no está definida.
+        
+        Ejemplo:
+            >>> config = Cpp_config(ruta_compilador="C:/ruta/al/cl.exe")
+            >>> config.config_estandar_many(["C:/proyecto_a", "C:/proyecto_b"])
+        """
+        # Importación diferida: concurrent.futures arrastra logging, traceback,
+        # etc. y solo hace falta en esta API.
+        from concurrent.futures import ThreadPoolExecutor
+
+        payload = self._serialize_estandar()
+        # Cada destino se escribe una sola vez aunque aparezca repetido.
+        cwd = os.getcwd()
+        rutas = dict.fromkeys(os.path.normpath(os.path.join(cwd, ruta)) for ruta in rutas)
+        with ThreadPoolExecutor() as pool:
+            # list() consume el iterador para propagar cualquier excepción.
+            list(pool.map(lambda ruta: self._write(ruta, payload), rutas))
 
     def config_pybind(self, ruta: str | None = None) -> None:
         """
@@ -147,7 +400,7 @@ class Cpp_config:
         
         Args:
             ruta: Ruta del proyecto donde crear .vscode/c_cpp_properties.json.
-                  Si es None, usa el directorio actual (os.getcwd()).
+                  Si es None, usa "." (el directorio actual).
         
         Raises:
             ValueError: Si faltan python_dll o pybind11_dll en la instancia.
@@ -160,14 +413,16 @@ class Cpp_config:
             ... )
             >>> config.config_pybind()  # Genera en directorio actual
         """
-        if ruta is None:
-            ruta = os.getcwd()
-        os.makedirs(f"{ruta}/.vscode", exist_ok=True)
-        with open(f"{ruta}/.vscode/c_cpp_properties.json", "w") as f:
-            json.dump(self._build_config_pybind(), f, indent=4)
+        self._write(ruta, self._serialize_pybind())
     
 
-class Cpp_config_auto:
+# Rutas predefinidas usadas por Cpp_config_auto.
+_AUTO_CL = "C:/Program Files (x86)/Microsoft Visual Studio/2022/BuildTools/VC/Tools/MSVC/14.44.35207/bin/Hostx64/x64/cl.exe"
+_AUTO_PY = "C:/Users/SZ/AppData/Local/Programs/Python/Python312/include"
+_AUTO_PB = "C:/Users/SZ/AppData/Local/Programs/Python/Python312/Lib/site-packages/pybind11/include"
+
+
+class Cpp_config_auto(Cpp_config):
     """
     Configurador automático de C++ para Visual Studio Code.
     
@@ -188,88 +443,12 @@ class Cpp_config_auto:
         >>> config.config_pybind()  # Genera en directorio actual
         >>> config.config_estandar("C:/mi/proyecto")  # Genera en ruta específica
     """
+    __slots__ = ()
+
     def __init__(self):
         """
         Inicializa el configurador automático.
         
         No requiere parámetros ya que utiliza rutas predefinidas.
         """
-        pass
-
-    def config_estandar(self, ruta: str | None = None):
-        """
-        Genera archivo c_cpp_properties.json con configuración predefinida.
-        
-        Usa rutas estándar para el compilador MSVC sin incluir pybind11.
-        
-        Args:
-            ruta: Ruta del proyecto donde crear .vscode/c_cpp_properties.json.
-                  Si es None, usa el directorio actual (os.getcwd()).
-        
-        Ejemplo:
-            >>> config = Cpp_config_auto()
-            >>> config.config_estandar()  # Genera en directorio actual
-        """
-        if ruta is None:
-            ruta = os.getcwd()
-        os.makedirs(f"{ruta}/.vscode", exist_ok=True)
-        with open(f"{ruta}/.vscode/c_cpp_properties.json", "w") as f:
-            json.dump(estandar_1, f, indent=4)
-
-    def config_pybind(self, ruta: str | None = None):
-        """
-        Genera archivo c_cpp_properties.json con soporte pybind11 predefinido.
-        
-        Usa rutas estándar para el compilador MSVC, Python y pybind11.
-        
-        Args:
-            ruta: Ruta del proyecto donde crear .vscode/c_cpp_properties.json.
-                  Si es None, usa el directorio actual (os.getcwd()).
-        
-        Ejemplo:
-            >>> config = Cpp_config_auto()
-            >>> config.config_pybind()  # Genera en directorio actual con pybind11
-        """
-        if ruta is None:
-            ruta = os.getcwd()
-        os.makedirs(f"{ruta}/.vscode", exist_ok=True)
-        with open(f"{ruta}/.vscode/c_cpp_properties.json", "w") as f:
-            json.dump(pybind_2, f, indent=4)
-
-
-estandar_1 = {
-    "configurations": [
-        {
-            "name": "MSVC",
-            "includePath": [
-                "${workspaceFolder}/**",
-                "C:/Users/SZ/AppData/Local/Programs/Python/Python312/Lib/site-packages/pybind11/include",
-                "C:/Users/SZ/AppData/Local/Programs/Python/Python312/include"
-            ],
-            "compilerPath": "C:/Program Files (x86)/Microsoft Visual Studio/2022/BuildTools/VC/Tools/MSVC/14.44.35207/bin/Hostx64/x64/cl.exe",
-            "cStandard": "c17",
-            "cppStandard": "c++20",
-            "intelliSenseMode": "windows-msvc-x64"
-        }
-    ],
-    "version": 4
-}
-
-pybind_2 = {
-    "configurations": [
-        {
-            "name": "MSVC",
-            "includePath": [
-                "${workspaceFolder}/**",
-                "C:/Users/SZ/AppData/Local/Programs/Python/Python312/Lib/site-packages/pybind11/include",
-                "C:/Users/SZ/AppData/Local/Programs/Python/Python312/include"
-            ],
-            "compilerPath": "C:/Program Files (x86)/Microsoft Visual Studio/2022/BuildTools/VC/Tools/MSVC/14.44.35207/bin/Hostx64/x64/cl.exe",
-            "cStandard": "c17",
-            "cppStandard": "c++20",
-            "intelliSenseMode": "windows-msvc-x64"
-        }
-    ],
-    "version": 4
-}
-
+        super().__init__(ruta_compilador=_AUTO_CL, python_dll=_AUTO_PY, pybind11_dll=_AUTO_PB)
@@ -0,0 +1,138 @@
+import json
+import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from cpp_config import Cpp_config, Cpp_config_auto
+
+
+CL = 'C:/Program Files/MSVC/"bin"\\cl.exe'
+PYTHON = "C:/Users/José/Python312/include"
+PYBIND11 = "C:/Users/José/Python312/Lib/site-packages/pybind11/include"
+
+
+def _esperado(include_path: list[str], compiler_path: str) -> bytes:
+    """Salida de referencia: json.dumps(..., indent=4) como en la versión original."""
+    return json.dumps(
+        {
+            "configurations": [
+                {
+                    "name": "MSVC",
+                    "includePath": include_path,
+                    "compilerPath": compiler_path,
+                    "cStandard": "c17",
+                    "cppStandard": "c++20",
+                    "intelliSenseMode": "windows-msvc-x64",
+                }
+            ],
+            "version": 4,
+        },
+        indent=4,
+    ).encode("utf-8")
+
+
+def _leer(ruta) -> bytes:
+    with open(os.path.join(ruta, ".vscode", "c_cpp_properties.json"), "rb") as f:
+        return f.read()
+
+
+def test_cambiar_ruta_invalida_cache():
+    config = Cpp_config(ruta_compilador="C:/a/cl.exe")
+    config.config_estandar_bytes()
+    config.ruta_compilador = "C:/b/cl.exe"
+    assert b"C:/b/cl.exe" in config.config_estandar_bytes()
+
+
+def test_faltan_rutas_pybind():
+    config = Cpp_config(ruta_compilador=CL, python_dll=PYTHON)
+    with pytest.raises(ValueError, match="pybind11_dll"):
+        config.config_pybind_bytes()
+
+
+def test_estandar_identico_a_json_dumps():
+    config = Cpp_config(ruta_compilador=CL)
+    assert config.config_estandar_bytes() == _esperado(["${workspaceFolder}/**"], CL)
+
+
+def test_pybind_identico_a_json_dumps():
+    config = Cpp_config(ruta_compilador=CL, python_dll=PYTHON, pybind11_dll=PYBIND11)
+    assert config.config_pybind_bytes() == _esperado(
+        ["${workspaceFolder}/**", PYBIND11, PYTHON], CL
+    )
+
+
+def test_config_pybind_escribe_archivo(tmp_path):
+    config = Cpp_config(ruta_compilador=CL, python_dll=PYTHON, pybind11_dll=PYBIND11)
+    config.config_pybind(str(tmp_path))
+    assert _leer(tmp_path) == config.config_pybind_bytes()
+    assert os.listdir(tmp_path / ".vscode") == ["c_cpp_properties.json"]
+
+
+def test_sin_ruta_sigue_al_directorio_actual(tmp_path, monkeypatch):
+    p1 = tmp_path / "p1"
+    p2 = tmp_path / "p2"
+    p1.mkdir()
+    p2.mkdir()
+    config = Cpp_config(ruta_compilador=CL)
+    monkeypatch.chdir(p1)
+    config.config_estandar()
+    monkeypatch.chdir(p2)
+    config.config_estandar()
+    assert _leer(p1) == _leer(p2) == config.config_estandar_bytes()
+
+
+def test_config_estandar_many_rutas_repetidas(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    config = Cpp_config(ruta_compilador=CL)
+    config.config_estandar_many(["x"] * 50 + [str(tmp_path / "x"), "y"])
+    for nombre in ("x", "y"):
+        assert _leer(tmp_path / nombre) == config.config_estandar_bytes()
+        assert os.listdir(tmp_path / nombre / ".vscode") == ["c_cpp_properties.json"]
+
+
+def test_config_estandar_many_proyectos_independientes(tmp_path):
+    rutas = [str(tmp_path / "y"), str(tmp_path / "z")]
+    config = Cpp_config_auto()
+    config.config_estandar_many(rutas)
+
+    # Editar un proyecto en el lugar no debe afectar a los demás.
+    with open(os.path.join(rutas[0], ".vscode", "c_cpp_properties.json"), "wb") as f:
+        f.write(b'{"edited": true}')
+    assert _leer(rutas[1]) == config.config_estandar_bytes()
+
+    # Volver a generar repara el proyecto editado.
+    config.config_estandar_many(rutas)
+    assert _leer(rutas[0]) == config.config_estandar_bytes()
+
+
+def test_escrituras_concurrentes_mismo_destino(tmp_path):
+    config = Cpp_config(ruta_compilador=CL)
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        list(pool.map(lambda _: config.config_estandar(str(tmp_path)), range(200)))
+    assert _leer(tmp_path) == config.config_estandar_bytes()
+    assert os.listdir(tmp_path / ".vscode") == ["c_cpp_properties.json"]
+
+
+@pytest.mark.skipif(os.name == "nt", reason="permisos POSIX")
+def test_reescritura_conserva_permisos(tmp_path):
+    config = Cpp_config(ruta_compilador=CL)
+    config.config_estandar(str(tmp_path))
+    destino = tmp_path / ".vscode" / "c_cpp_properties.json"
+    os.chmod(destino, 0o600)
+    config.ruta_compilador = "C:/otro/cl.exe"
+    config.config_estandar(str(tmp_path))
+    assert stat.S_IMODE(os.stat(destino).st_mode) == 0o600
+    assert b"C:/otro/cl.exe" in _leer(tmp_path)
+
+
+@pytest.mark.skipif(os.name == "nt", reason="permisos POSIX")
+def test_archivo_nuevo_respeta_umask(tmp_path):
+    anterior = os.umask(0o027)
+    try:
+        Cpp_config(ruta_compilador=CL).config_estandar(str(tmp_path))
+    finally:
+        os.umask(anterior)
+    destino = tmp_path / ".vscode" / "c_cpp_properties.json"
+    assert stat.S_IMODE(os.stat(destino).st_mode) == 0o640